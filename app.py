@@ -1,14 +1,101 @@
+import time
+_IMPORT_START = time.perf_counter()
+
 from flask import Flask, render_template, request, jsonify, session, Response
+import os
 import secrets
+import tempfile
 import asyncio
 import io
 import re
-import edge_tts
-from chatbot.engine import ChatbotEngine
 
 app = Flask(__name__)
-app.secret_key = secrets.token_hex(16)
-bot = ChatbotEngine()
+
+
+def _read_secret_key(path):
+    """Return the stored key, or None if the file is missing or empty."""
+    try:
+        with open(path) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _load_secret_key():
+    """
+    Return a persistent session secret so sessions survive restarts and are
+    valid across every worker. Uses $SECRET_KEY if set, otherwise a key stored
+    in the Flask instance folder (created once, on first start).
+    """
+    key = os.environ.get('SECRET_KEY')
+    if key:
+        return key
+
+    path = os.path.join(app.instance_path, 'secret_key')
+    try:
+        key = _read_secret_key(path)
+        if key:
+            return key
+
+        # Write the new key to a temp file and link it into place, so other
+        # processes only ever see a missing file or a complete key.
+        os.makedirs(app.instance_path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=app.instance_path)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(secrets.token_hex(32))
+            try:
+                os.link(tmp_path, path)
+            except FileExistsError:
+                # Another process won the race, or an empty file was left behind
+                key = _read_secret_key(path)
+                if key:
+                    return key
+                os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return _read_secret_key(path)
+    except OSError as e:
+        print(f'[Startup] Warning: cannot persist secret key in {app.instance_path} ({e}); '
+              'using a random key — set SECRET_KEY so sessions survive restarts.')
+        return secrets.token_hex(32)
+
+
+app.secret_key = _load_secret_key()
+
+# The chatbot engine (and its `requests` backend) is created on first use, or
+# up front by warm_up() when running under the pre-forking production server.
+_bot = None
+
+
+def get_bot():
+    global _bot
+    if _bot is None:
+        from chatbot.engine import ChatbotEngine
+        _bot = ChatbotEngine()
+    return _bot
+
+
+def warm_up():
+    """
+    Import the LLM/TTS backends and build the KB-derived indexes. Call once in
+    the master process before forking so workers share them copy-on-write.
+    """
+    start = time.perf_counter()
+    get_bot()
+    import requests  # noqa: F401  (LLM + weather backend)
+    import edge_tts  # noqa: F401  (TTS backend)
+    _report_startup(warm_up_ms=(time.perf_counter() - start) * 1000)
+
+
+def _report_startup(warm_up_ms=None):
+    """Print import (and warm-up) timings; called only from the launch paths."""
+    line = f'[Startup] app imported in {_IMPORT_MS:.1f} ms'
+    if warm_up_ms is not None:
+        line += f', warm-up finished in {warm_up_ms:.1f} ms'
+    print(line)
+
 
 # ─── Edge-TTS Voice Configuration (FREE — no API key needed) ───
 # Filipino voices:  fil-PH-BlessicaNeural (female), fil-PH-AngeloNeural (male)
@@ -49,7 +136,7 @@ def chat():
     if len(chat_history) > 10:
         chat_history = chat_history[-10:]
 
-    response, new_context = bot.process_message(user_message, user_context, chat_history)
+    response, new_context = get_bot().process_message(user_message, user_context, chat_history)
     
     # Append bot's response to history
     chat_history.append({"role": "assistant", "content": response})
@@ -113,6 +200,8 @@ def text_to_speech():
 
 async def _generate_speech(text, voice):
     """Generate speech audio bytes using edge-tts."""
+    import edge_tts  # deferred: heavy import, only needed for TTS requests
+
     communicate = edge_tts.Communicate(text, voice, rate='+5%', pitch='+0Hz')
     buffer = io.BytesIO()
 
@@ -124,5 +213,12 @@ async def _generate_speech(text, voice):
     return buffer.read()
 
 
+_IMPORT_MS = (time.perf_counter() - _IMPORT_START) * 1000
+
+
 if __name__ == '__main__':
+    from werkzeug.serving import is_running_from_reloader
+    # The debug reloader re-runs this file in a child process; report once there
+    if is_running_from_reloader():
+        _report_startup()
     app.run(debug=True, port=5000)
@@ -1,9 +1,30 @@
 import difflib
-import requests
-import json
 from .knowledge import KNOWLEDGE_BASE, RESPONSES
 from .languages import LanguageDetector
 
+# KB-derived data (prompt block, per-category keyword/topic tuples).
+# Built once per process by build_kb_index(); when the app is preloaded in a
+# pre-forking server this happens in the master, so every worker shares it.
+_KB_INDEX = None
+
+
+def build_kb_index():
+    """Build (or return the cached) index derived from KNOWLEDGE_BASE."""
+    global _KB_INDEX
+    if _KB_INDEX is None:
+        categories = []
+        prompt = ""
+        for category, data in KNOWLEDGE_BASE.items():
+            categories.append((
+                category,
+                tuple(data['keywords']),
+                tuple(data['topics']),
+                data['responses']
+            ))
+            prompt += f"--- {category.upper()} ---\n{data['responses']['en']}\n\n"
+        _KB_INDEX = {'categories': tuple(categories), 'prompt': prompt}
+    return _KB_INDEX
+
 
 class ChatbotEngine:
     """
@@ -15,12 +36,15 @@ class ChatbotEngine:
     """
 
     def __init__(self):
-        self.knowledge = KNOWLEDGE_BASE
         self.responses = RESPONSES
         self.threshold = 0.55
+        # Source of truth for intent matching and the Ollama system prompt
+        self.index = build_kb_index()
 
     def get_live_weather(self, lat, lon):
         """Fetch current weather using open-meteo API for real-time local data"""
+        import requests  # deferred: keeps app import / worker boot fast
+
         try:
             # Validate coordinates to prevent "null" or "undefined" breaking the API
             try:
@@ -143,23 +167,23 @@ class ChatbotEngine:
         best_score = 0
         matched_category = None
 
-        for category, data in self.knowledge.items():
+        for category, keywords, topics, responses in self.index['categories']:
             score = 0
 
             # Keyword exact match (strongest signal)
-            for keyword in data['keywords']:
+            for keyword in keywords:
                 if keyword in message_lower:
                     score += 3
 
             # Topic fuzzy match
-            for topic in data['topics']:
+            for topic in topics:
                 ratio = difflib.SequenceMatcher(None, message_lower, topic).ratio()
                 if ratio > 0.6:
                     score += ratio * 2
 
             if score > best_score:
                 best_score = score
-                best_match = data['responses'].get(lang, data['responses']['en'])
+                best_match = responses.get(lang, responses['en'])
                 matched_category = category
 
         if best_score >= 1.0:
@@ -173,6 +197,8 @@ class ChatbotEngine:
         """
         Send the message history to local Ollama instance using the /api/chat endpoint.
         """
+        import requests  # deferred: keeps app import / worker boot fast
+
         url = "http://localhost:11434/api/chat"
         
         # Build a strict system prompt using our KNOWLEDGE_BASE
@@ -188,11 +214,8 @@ class ChatbotEngine:
             "If the answer is not in the knowledge base or weather data, just say you don't have that information.\n\n"
             "KNOWLEDGE BASE:\n"
         )
-        
-        for category, data in self.knowledge.items():
-            info = data['responses']['en']
-            system_prompt += f"--- {category.upper()} ---\n{info}\n\n"
-            
+        system_prompt += self.index['prompt']
+
         messages = [{"role": "system", "content": system_prompt}]
         messages.extend(history)
             
@@ -0,0 +1,17 @@
+# Production launch config:  gunicorn app:app
+# The app is loaded once in the master and warmed up before the workers are
+# forked, so the engine and KB indexes are shared copy-on-write.
+import gc
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+preload_app = True
+
+
+def when_ready(server):
+    import app
+    app.warm_up()
+    # Move everything built so far out of the GC's tracked generations so
+    # collections in the workers don't touch (and copy) the shared pages.
+    gc.freeze()